@@ -1,5 +1,8 @@
-from django.test import TestCase
-from django.http import HttpRequest
+import difflib
+from itertools import islice
+
+from django.conf import settings
+from django.test import RequestFactory, SimpleTestCase, override_settings
 from django.template.loader import render_to_string
 
 # Import a reference to the views.
@@ -7,26 +10,58 @@ from lists.views import home_page
 
 # Create your tests here.
 
-class HomePageViewTest(TestCase):
+# The project templates behind the cached loader, so each template is parsed once
+# per test run. Development settings keep APP_DIRS so runserver sees template edits.
+CACHED_TEMPLATES = [dict(
+    settings.TEMPLATES[0],
+    APP_DIRS=False,
+    OPTIONS=dict(settings.TEMPLATES[0]['OPTIONS'], loaders=[
+        ('django.template.loaders.cached.Loader', [
+            'django.template.loaders.filesystem.Loader',
+            'django.template.loaders.app_directories.Loader',
+        ]),
+    ]),
+)]
+
+# No models are touched here, so SimpleTestCase skips the per-test transaction.
+@override_settings(TEMPLATES=CACHED_TEMPLATES)
+class HomePageViewTest(SimpleTestCase):
     """Testing HomePageView"""
 
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # One RequestFactory is enough for every test; it keeps no per-request state.
+        cls.factory = RequestFactory()
+        # Read in the template file once for the whole class.
+        cls._expected_home = render_to_string('home.html')
+
+    def assertContentEqual(self, content, expected_content):
+        """Compare response bytes to rendered text, with a short diff on mismatch."""
+        if content == expected_content.encode('utf8'):
+            return
+
+        # Only build a diff when the contents differ, and keep it bounded.
+        diff = difflib.unified_diff(
+            content.decode('utf8', 'replace').splitlines(),
+            expected_content.splitlines(),
+            'response', 'expected', n=3, lineterm=''
+        )
+        self.fail('Response content does not match:\n' + '\n'.join(islice(diff, 50)))
+
     def test_home_page_uses_home_template(self):
-        request = HttpRequest()
+        request = self.factory.get('/')
         response = home_page(request)
 
-        # Read in the template file.
-        expected_content = render_to_string('home.html')
-
         # Compare the template content with the response content.
-        self.assertEqual(
-            response.content.decode('utf8'),
-            expected_content
+        # Compare as bytes so the response body never has to be decoded.
+        self.assertContentEqual(
+            response.content,
+            self._expected_home
         )
 
     def test_home_page_can_store_post_requests(self):
-        request = HttpRequest()
-        request.method = 'POST'
-        request.POST['item_text'] = 'new item'
+        request = self.factory.post('/', {'item_text': 'new item'})
         response = home_page(request)
 
         expected_content = render_to_string(
@@ -39,7 +74,7 @@ class HomePageViewTest(TestCase):
         #     response.content.decode('utf8')
         # )
 
-        self.assertEqual(
-            response.content.decode('utf8'),
+        self.assertContentEqual(
+            response.content,
             expected_content
         )